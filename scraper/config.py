@@ -6,6 +6,7 @@ from pathlib import Path
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DOCS_DIR = PROJECT_ROOT / "docs"
+MARKDOWN_DIR = DOCS_DIR / "markdown"
 
 # Rhino versions
 SUPPORTED_VERSIONS = ["7", "8"]
@@ -29,6 +30,9 @@ NAMESPACES = [
     "rhino.plugins",
 ]
 
+# Corpus-wide files written next to the namespace JSON files
+INDEX_FILES = ["index.json", "ids.json", "graph.json", "symbols.json"]
+
 # Scraper settings
 SCRAPER_DELAY = 0.5  # seconds between requests
 SCRAPER_TIMEOUT = 10  # seconds
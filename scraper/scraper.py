@@ -5,6 +5,7 @@ import logging
 from pathlib import Path
 from xml_parser import XMLDocParser
 from web_scraper import WebScraper
+from utils import create_markdown_all
 import config
 
 logging.basicConfig(
@@ -26,6 +27,12 @@ def main():
                        help='Scrape all namespaces')
     parser.add_argument('--output', help='Output directory',
                        default=str(config.DOCS_DIR))
+    parser.add_argument('--markdown', action='store_true',
+                       help='Also render every namespace to Markdown')
+    parser.add_argument('--markdown-output', help='Markdown output directory',
+                       default=str(config.MARKDOWN_DIR))
+    parser.add_argument('--workers', type=int,
+                       help='Parallel Markdown workers (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -61,6 +68,11 @@ def main():
         
         scraper.create_index()
     
+    if args.markdown:
+        markdown_dir = Path(args.markdown_output) / f"v{args.version}"
+        logger.info(f"Rendering markdown: {markdown_dir}")
+        create_markdown_all(output_dir, markdown_dir, args.workers)
+    
     logger.info("✅ Scraping complete!")
 
 
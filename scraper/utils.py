@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -35,42 +35,150 @@ def find_xml_file(version: str = "8") -> Optional[Path]:
     return None
 
 
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between a and b"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+    return previous[-1]
+
+
+def build_name_tree(words: List[str]) -> List[list]:
+    """Build a BK-tree for "did you mean" lookups
+    
+    Returns flat nodes [word, [[distance, child node], ...]] with the root at 0,
+    the layout server/symbol_index.BKTree loads. Insertion must match
+    BKTree.add(), tests/test_symbol_index.py checks both build the same tree.
+    """
+    words_out = []
+    children = []
+    for word in words:
+        if not words_out:
+            words_out.append(word)
+            children.append({})
+            continue
+        
+        node = 0
+        while True:
+            distance = edit_distance(word, words_out[node])
+            if distance == 0:
+                break
+            child = children[node].get(distance)
+            if child is None:
+                children[node][distance] = len(words_out)
+                words_out.append(word)
+                children.append({})
+                break
+            node = child
+    
+    return [[word, sorted(node_children.items())] for word, node_children in zip(words_out, children)]
+
+
 def create_markdown(json_data: dict, output_path: Path):
-    """Convert JSON documentation to Markdown"""
+    """Convert JSON documentation to Markdown
+    
+    Writes each class as it is rendered instead of building the whole
+    document in memory, every member is included.
+    """
     namespace = json_data.get('namespace', 'Unknown')
     classes = json_data.get('classes', [])
     
-    md_content = f"# {namespace}\n\n"
-    md_content += f"**Total Classes**: {len(classes)}\n\n"
-    
-    for cls in classes:
-        md_content += f"## {cls['name']}\n\n"
-        
-        if cls.get('description'):
-            md_content += f"{cls['description']}\n\n"
-        
-        # Methods
-        methods = cls.get('methods', [])
-        if methods:
-            md_content += f"### Methods ({len(methods)})\n\n"
-            for method in methods[:10]:  # Limit to first 10
-                md_content += f"#### {method['name']}\n\n"
-                if method.get('signature'):
-                    md_content += f"```csharp\n{method['signature']}\n```\n\n"
-                if method.get('description'):
-                    md_content += f"{method['description']}\n\n"
-        
-        # Properties
-        properties = cls.get('properties', [])
-        if properties:
-            md_content += f"### Properties ({len(properties)})\n\n"
-            for prop in properties[:10]:  # Limit to first 10
-                md_content += f"- **{prop['name']}**: {prop.get('description', 'No description')}\n"
-            md_content += "\n"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(f"# {namespace}\n\n")
+        f.write(f"**Total Classes**: {len(classes)}\n\n")
         
-        md_content += "---\n\n"
+        for cls in classes:
+            f.writelines(_class_markdown(cls))
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(md_content)
+    logger.info(f"Created markdown: {output_path}")
+
+
+def _class_markdown(cls: dict):
+    """Yield Markdown chunks for one class"""
+    yield f"## {cls['name']}\n\n"
+    
+    if cls.get('description'):
+        yield f"{cls['description']}\n\n"
+    
+    # Methods
+    methods = cls.get('methods', [])
+    if methods:
+        yield f"### Methods ({len(methods)})\n\n"
+        for method in methods:
+            yield f"#### {method['name']}\n\n"
+            if method.get('signature'):
+                yield f"```csharp\n{method['signature']}\n```\n\n"
+            if method.get('description'):
+                yield f"{method['description']}\n\n"
+            for param in method.get('parameters', []):
+                label = " ".join(
+                    f"`{part}`" for part in (param.get('name'), param.get('type')) if part
+                )
+                description = param.get('description', '')
+                if label and description:
+                    yield f"- {label}: {description}\n"
+                elif label or description:
+                    yield f"- {label or description}\n"
+            if method.get('parameters'):
+                yield "\n"
+            if method.get('returns'):
+                yield f"**Returns**: {method['returns']}\n\n"
+    
+    # Properties
+    properties = cls.get('properties', [])
+    if properties:
+        yield f"### Properties ({len(properties)})\n\n"
+        for prop in properties:
+            yield f"- **{prop['name']}**: {prop.get('description') or 'No description'}\n"
+        yield "\n"
+    
+    # Fields
+    fields = cls.get('fields', [])
+    if fields:
+        yield f"### Fields ({len(fields)})\n\n"
+        for field in fields:
+            yield f"- **{field['name']}**: {field.get('description') or 'No description'}\n"
+        yield "\n"
+    
+    yield "---\n\n"
+
+
+def _convert_namespace_file(json_path: Path, output_dir: Path) -> Path:
+    """Render one namespace JSON file to Markdown, run in a worker process"""
+    import json
+    
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    output_path = output_dir / json_path.with_suffix('.md').name
+    create_markdown(data, output_path)
+    return output_path
+
+
+def create_markdown_all(docs_dir: Path, output_dir: Path, workers: Optional[int] = None) -> List[Path]:
+    """Convert every namespace JSON file in docs_dir to Markdown, in parallel"""
+    from concurrent.futures import ProcessPoolExecutor
+    import config
+    
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    json_files = [
+        path for path in sorted(Path(docs_dir).glob('*.json'))
+        if path.name not in config.INDEX_FILES
+    ]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outputs = list(executor.map(_convert_namespace_file, json_files, [output_dir] * len(json_files)))
     
-    logger.info(f"Created markdown: {output_path}")
\ No newline at end of file
+    logger.info(f"Created {len(outputs)} markdown files in {output_dir}")
+    return outputs
\ No newline at end of file
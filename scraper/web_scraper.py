@@ -86,7 +86,7 @@ class WebScraper:
         total_classes = 0
         
         for json_file in self.output_dir.glob('*.json'):
-            if json_file.name == 'index.json':
+            if json_file.name in config.INDEX_FILES:
                 continue
             
             with open(json_file, 'r', encoding='utf-8') as f:
@@ -3,11 +3,21 @@
 import xml.etree.ElementTree as ET
 import json
 import logging
+import re
+from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from utils import build_name_tree
+
 logger = logging.getLogger(__name__)
 
+# Qualified type names inside a doc ID type string, e.g. "IEnumerable{Rhino.Geometry.Curve}"
+TYPE_NAME_PATTERN = re.compile(r'[A-Za-z_][\w.]*')
+
+# Relations stored in graph.json
+GRAPH_RELATIONS = ('references', 'returns', 'accepts')
+
 
 class XMLDocParser:
     """Parse RhinoCommon XML documentation"""
@@ -16,6 +26,9 @@ class XMLDocParser:
         self.xml_path = Path(xml_path)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.graph = {relation: defaultdict(set) for relation in GRAPH_RELATIONS}
+        self.cref_counts = Counter()
+        self._classes = {}
         
         if not self.xml_path.exists():
             raise FileNotFoundError(f"XML file not found: {xml_path}")
@@ -33,6 +46,9 @@ class XMLDocParser:
         
         # Group by namespace
         docs_by_namespace = {}
+        self.graph = {relation: defaultdict(set) for relation in GRAPH_RELATIONS}
+        self.cref_counts = Counter()  # cref target without parameters -> links to it
+        self._classes = {}  # full_name -> class_info
         
         for member in root.findall('.//member'):
             name = member.get('name', '')
@@ -69,6 +85,7 @@ class XMLDocParser:
             docs[namespace] = {'namespace': namespace, 'classes': []}
         
         class_info = {
+            'id': f"T:{full_name}",
             'name': class_name,
             'full_name': full_name,
             'description': self._get_text(element, 'summary'),
@@ -80,126 +97,189 @@ class XMLDocParser:
         }
         
         docs[namespace]['classes'].append(class_info)
+        self._classes[full_name] = class_info
+        self._add_edges(class_info['id'], references=self._get_crefs(element))
+    
+    def _find_class(self, full_name: str):
+        """Find the parsed class declaring a member
+        
+        Format: Rhino.Geometry.NurbsSurface.Create(...), the parameter list is optional.
+        Returns (class_info, member_name), class_info is None for unknown classes.
+        """
+        class_full_name, _, member_name = full_name.split('(')[0].rpartition('.')
+        return self._classes.get(class_full_name), member_name
     
     def _parse_method(self, element: ET.Element, full_name: str, docs: Dict):
         """Parse method documentation"""
-        # Extract class and method name
-        # Format: Rhino.Geometry.NurbsSurface.Create(...)
-        if '(' in full_name:
-            full_name = full_name.split('(')[0]
-        
-        parts = full_name.rsplit('.', 1)
-        if len(parts) != 2:
-            return
+        member_id = f"M:{full_name}"
+        full_name, _, conversion_type = full_name.partition('~')
         
-        class_full_name = parts[0]
-        method_name = parts[1]
-        
-        if not class_full_name.startswith('Rhino.'):
-            return
-        
-        # Find namespace and class
-        class_parts = class_full_name.rsplit('.', 1)
-        if len(class_parts) != 2:
-            return
-        
-        namespace = class_parts[0].lower()
-        
-        if namespace not in docs:
+        cls, method_name = self._find_class(full_name)
+        if cls is None:
             return
         
-        # Find the class
-        for cls in docs[namespace]['classes']:
-            if cls['full_name'] == class_full_name:
-                method_info = {
-                    'name': method_name,
-                    'signature': full_name,
-                    'description': self._get_text(element, 'summary'),
-                    'parameters': self._get_params(element),
-                    'returns': self._get_text(element, 'returns'),
-                    'remarks': self._get_text(element, 'remarks')
-                }
-                cls['methods'].append(method_info)
-                break
+        param_types = self._parse_param_types(full_name)
+        returns_types = self._get_crefs(element.find('returns'), 'T:')
+        if conversion_type:
+            returns_types.insert(0, conversion_type)
+        elif method_name == '#ctor':
+            returns_types.insert(0, cls['full_name'])
+        
+        method_info = {
+            'id': member_id,
+            'name': method_name,
+            'signature': full_name,
+            'description': self._get_text(element, 'summary'),
+            'parameters': self._get_params(element, param_types),
+            'returns': self._get_text(element, 'returns'),
+            'returns_type': returns_types[0] if returns_types else "",
+            'remarks': self._get_text(element, 'remarks'),
+            'references': self._get_crefs(element)
+        }
+        cls['methods'].append(method_info)
+        self._add_edges(
+            member_id,
+            references=method_info['references'],
+            returns=returns_types,
+            accepts=param_types
+        )
     
     def _parse_property(self, element: ET.Element, full_name: str, docs: Dict):
         """Parse property documentation"""
-        parts = full_name.rsplit('.', 1)
-        if len(parts) != 2:
+        cls, property_name = self._find_class(full_name)
+        if cls is None:
             return
         
-        class_full_name = parts[0]
-        property_name = parts[1]
-        
-        if not class_full_name.startswith('Rhino.'):
-            return
-        
-        class_parts = class_full_name.rsplit('.', 1)
-        if len(class_parts) != 2:
-            return
+        # Indexers carry a parameter list, e.g. Rhino.Geometry.Collections.BrepFaceList.Item(System.Int32)
+        param_types = self._parse_param_types(full_name)
         
-        namespace = class_parts[0].lower()
-        
-        if namespace not in docs:
-            return
-        
-        for cls in docs[namespace]['classes']:
-            if cls['full_name'] == class_full_name:
-                property_info = {
-                    'name': property_name,
-                    'description': self._get_text(element, 'summary'),
-                    'value': self._get_text(element, 'value')
-                }
-                cls['properties'].append(property_info)
-                break
+        property_info = {
+            'id': f"P:{full_name}",
+            'name': property_name,
+            'signature': full_name,
+            'description': self._get_text(element, 'summary'),
+            'value': self._get_text(element, 'value'),
+            'references': self._get_crefs(element)
+        }
+        if param_types:
+            property_info['parameters'] = self._get_params(element, param_types)
+        
+        cls['properties'].append(property_info)
+        self._add_edges(
+            property_info['id'],
+            references=property_info['references'],
+            returns=self._get_crefs(element.find('value'), 'T:'),
+            accepts=param_types
+        )
     
     def _parse_field(self, element: ET.Element, full_name: str, docs: Dict):
         """Parse field documentation"""
-        parts = full_name.rsplit('.', 1)
-        if len(parts) != 2:
-            return
-        
-        class_full_name = parts[0]
-        field_name = parts[1]
-        
-        if not class_full_name.startswith('Rhino.'):
+        cls, field_name = self._find_class(full_name)
+        if cls is None:
             return
         
-        class_parts = class_full_name.rsplit('.', 1)
-        if len(class_parts) != 2:
-            return
-        
-        namespace = class_parts[0].lower()
-        
-        if namespace not in docs:
-            return
-        
-        for cls in docs[namespace]['classes']:
-            if cls['full_name'] == class_full_name:
-                field_info = {
-                    'name': field_name,
-                    'description': self._get_text(element, 'summary')
-                }
-                cls['fields'].append(field_info)
-                break
+        field_info = {
+            'id': f"F:{full_name}",
+            'name': field_name,
+            'description': self._get_text(element, 'summary'),
+            'references': self._get_crefs(element)
+        }
+        cls['fields'].append(field_info)
+        self._add_edges(field_info['id'], references=field_info['references'])
     
     def _get_text(self, element: ET.Element, tag: str) -> str:
         """Get text from XML element"""
         child = element.find(tag)
-        if child is not None and child.text:
-            return child.text.strip()
+        if child is not None:
+            return self._render_text(child).strip()
         return ""
     
-    def _get_params(self, element: ET.Element) -> List[Dict]:
+    def _render_text(self, element: ET.Element) -> str:
+        """Flatten element text, keeping inline <see>, <paramref> and similar children"""
+        parts = [element.text or ""]
+        for child in element:
+            if child.get('cref'):
+                parts.append(child.text or self._short_name(child.get('cref')))
+            elif child.get('langword'):
+                parts.append(child.get('langword'))
+            elif child.tag in ('paramref', 'typeparamref'):
+                parts.append(child.get('name', ''))
+            else:
+                parts.append(self._render_text(child))
+            parts.append(child.tail or "")
+        return "".join(parts)
+    
+    def _short_name(self, cref: str) -> str:
+        """Display name for a cref target, e.g. 'T:Rhino.Geometry.Curve' -> 'Curve'"""
+        name = cref[2:] if cref[1:2] == ':' else cref
+        return name.split('(')[0].rsplit('.', 1)[-1]
+    
+    def _get_crefs(self, element: Optional[ET.Element], prefix: str = '') -> List[str]:
+        """Get cref targets linked anywhere below element"""
+        if element is None:
+            return []
+        crefs = []
+        for child in element.iter():
+            cref = child.get('cref')
+            if cref and cref.startswith(prefix) and cref not in crefs:
+                crefs.append(cref)
+        if prefix:
+            return [cref[len(prefix):] for cref in crefs]
+        return crefs
+    
+    def _parse_param_types(self, full_name: str) -> List[str]:
+        """Split the parameter list of a doc ID into parameter types"""
+        if '(' not in full_name:
+            return []
+        params = full_name[full_name.index('(') + 1:full_name.rindex(')')]
+        
+        types = []
+        depth = 0
+        start = 0
+        for i, char in enumerate(params):
+            if char in '{[(':
+                depth += 1
+            elif char in '}])':
+                depth -= 1
+            elif char == ',' and depth == 0:
+                types.append(params[start:i])
+                start = i + 1
+        if params:
+            types.append(params[start:])
+        return types
+    
+    def _get_params(self, element: ET.Element, types: Optional[List[str]] = None) -> List[Dict]:
         """Get parameter information"""
+        types = types or []
         params = []
         for param in element.findall('param'):
             params.append({
                 'name': param.get('name', ''),
-                'description': param.text.strip() if param.text else ""
+                'description': self._render_text(param).strip()
             })
+        
+        if len(params) == len(types):
+            for param, param_type in zip(params, types):
+                param['type'] = param_type
+        elif not params:
+            params = [{'name': '', 'type': t, 'description': ""} for t in types]
         return params
     
+    def _add_edges(self, member_id: str, **relations: List[str]):
+        """Record graph edges from member_id to the Rhino types it mentions"""
+        for relation, targets in relations.items():
+            for target in targets:
+                if relation == 'references':
+                    self.cref_counts[target[2:].split('(')[0]] += 1
+                
+                if target.startswith('T:'):
+                    target = target[2:]
+                elif target[1:2] == ':':
+                    continue
+                for type_name in TYPE_NAME_PATTERN.findall(target):
+                    if type_name.startswith('Rhino.'):
+                        self.graph[relation][type_name].add(member_id)
+    
     def save(self, docs: Dict[str, List[Dict]]):
         """Save parsed documentation to JSON files"""
         logger.info(f"Saving documentation to {self.output_dir}")
@@ -214,7 +294,11 @@ class XMLDocParser:
             
             logger.info(f"Saved {namespace}: {len(data['classes'])} classes")
         
-        # Create index
+        self.save_ids(docs)
+        self.save_graph()
+        self.save_symbols(docs)
+        
+        # Create index last, the server watches it to detect a rebuilt corpus
         index = {
             'version': '8.0',
             'namespaces': list(docs.keys()),
@@ -225,4 +309,85 @@ class XMLDocParser:
         with open(index_path, 'w', encoding='utf-8') as f:
             json.dump(index, f, indent=2)
         
-        logger.info(f"Created index: {len(docs)} namespaces, {index['total_classes']} classes")
\ No newline at end of file
+        logger.info(f"Created index: {len(docs)} namespaces, {index['total_classes']} classes")
+    
+    def save_ids(self, docs: Dict[str, Dict]):
+        """Save documentation ID index
+        
+        Maps every full doc ID to [namespace, class position, member kind, member position]
+        so the server can fetch a single overload without scanning its class.
+        """
+        ids = {}
+        for namespace, data in docs.items():
+            for class_pos, cls in enumerate(data['classes']):
+                ids[cls['id']] = [namespace, class_pos, 'class', 0]
+                for kind in ('methods', 'properties', 'fields'):
+                    for member_pos, member in enumerate(cls[kind]):
+                        ids[member['id']] = [namespace, class_pos, kind, member_pos]
+        
+        ids_path = self.output_dir / 'ids.json'
+        with open(ids_path, 'w', encoding='utf-8') as f:
+            json.dump(ids, f, ensure_ascii=False)
+        
+        logger.info(f"Created ID index: {len(ids)} documentation IDs")
+    
+    def save_graph(self):
+        """Save the type cross-reference graph built during parse()"""
+        graph = {
+            relation: {
+                type_name: sorted(members)
+                for type_name, members in sorted(self.graph[relation].items())
+            }
+            for relation in GRAPH_RELATIONS
+        }
+        
+        graph_path = self.output_dir / 'graph.json'
+        with open(graph_path, 'w', encoding='utf-8') as f:
+            json.dump(graph, f, indent=2, ensure_ascii=False)
+        
+        logger.info(f"Created graph: {len(graph['references'])} referenced types, "
+                    f"{len(graph['returns'])} returned types, {len(graph['accepts'])} accepted types")
+    
+    def save_symbols(self, docs: Dict[str, Dict]):
+        """Save the symbol table used for name completion
+        
+        symbols: [display name, kind, namespace, popularity], one per class and per
+        overload group. keys: [lowercase name, symbol position] sorted by name, so
+        the server can binary search prefixes without sorting at startup. tree is a
+        prebuilt BK-tree over the simple names, see utils.build_name_tree().
+        Popularity counts doc links to the symbol, plus signature uses for types.
+        """
+        symbols = []
+        keys = []
+        for namespace, data in docs.items():
+            for cls in data['classes']:
+                popularity = sum(len(self.graph[relation].get(cls['full_name'], ())) for relation in GRAPH_RELATIONS)
+                keys.append([cls['name'].lower(), len(symbols)])
+                keys.append([cls['full_name'].lower(), len(symbols)])
+                symbols.append([cls['name'], 'class', namespace, popularity])
+                
+                for kind, symbol_kind in (('methods', 'method'), ('properties', 'property'), ('fields', 'field')):
+                    seen = set()
+                    for member in cls[kind]:
+                        name = member['name']
+                        if name in seen or name.startswith('#'):
+                            continue
+                        seen.add(name)
+                        
+                        qualified = f"{cls['name']}.{name}"
+                        popularity = self.cref_counts[f"{cls['full_name']}.{name}"]
+                        keys.append([name.lower(), len(symbols)])
+                        keys.append([qualified.lower(), len(symbols)])
+                        symbols.append([qualified, symbol_kind, namespace, popularity])
+        
+        keys.sort()
+        
+        # BK-tree over distinct simple names, for edit-distance suggestions
+        names = sorted({symbol[0].rsplit('.', 1)[-1].lower() for symbol in symbols})
+        tree = build_name_tree(names)
+        
+        symbols_path = self.output_dir / 'symbols.json'
+        with open(symbols_path, 'w', encoding='utf-8') as f:
+            json.dump({'symbols': symbols, 'keys': keys, 'tree': tree}, f, ensure_ascii=False)
+        
+        logger.info(f"Created symbol table: {len(symbols)} symbols, {len(keys)} keys")
\ No newline at end of file
@@ -0,0 +1,443 @@
+"""Load-test harness for the MCP server
+
+Launches server/mcp_server.py as local subprocesses, over stdio (one process
+per client, as IDEs run it) or over the HTTP transport (one process shared by
+all clients), and replays a recorded or synthetic mix of tool and resource
+calls at a fixed concurrency. Reports throughput, p50/p95/p99 latency,
+response sizes and server RSS over time, and can compare against an earlier
+report.
+
+    python scripts/load_test.py --transport stdio --clients 4 --requests 400
+    python scripts/load_test.py --transport http --clients 20 --concurrency 2 \\
+        --requests 2000 --output after.json --compare before.json
+
+Workload files are JSON lines, one call per line:
+
+    {"tool": "search_rhinocommon", "arguments": {"query": "Brep"}}
+    {"resource": "rhino://rhino.geometry"}
+
+--record writes the generated synthetic workload in that format so a run can
+be replayed exactly with --workload.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+# Per-request client logs would drown out the report
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("mcp").setLevel(logging.WARNING)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SERVER_PATH = PROJECT_ROOT / "server" / "mcp_server.py"
+
+# Relative weights of the synthetic workload
+DEFAULT_MIX = "search_rhinocommon=4,get_class_details=3,get_code_examples=1,read_resource=2"
+
+# Names used by the synthetic workload, a few deliberately misspelled
+SYNTHETIC_NAMES = [
+    "Brep", "NurbsCurve", "NurbsSurface", "Point3d", "Vector3d", "Plane",
+    "Curve", "Mesh", "Intersection", "Transform", "Line", "Circle",
+    "BoundingBox", "Extrusion", "RhinoDoc", "ObjRef", "NurbSurface", "Brepp",
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse 'name=weight,...' into a dict"""
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def synthetic_workload(count: int, mix: Dict[str, float], namespaces: List[str],
+                       output_format: Optional[str], seed: int) -> List[Dict]:
+    """Generate count calls drawn from mix"""
+    rng = random.Random(seed)
+    if not namespaces:
+        mix = {name: weight for name, weight in mix.items() if name != "read_resource"}
+    names = list(mix)
+    weights = [mix[name] for name in names]
+
+    calls = []
+    for _ in range(count):
+        kind = rng.choices(names, weights)[0]
+        name = rng.choice(SYNTHETIC_NAMES)
+
+        if kind == "read_resource":
+            uri = f"rhino://{rng.choice(namespaces)}"
+            if output_format == "markdown":
+                uri += "?format=markdown"
+            calls.append({"resource": uri})
+            continue
+
+        if kind == "search_rhinocommon":
+            arguments = {"query": name}
+        else:
+            arguments = {"class_name": name}
+        if output_format and kind in ("search_rhinocommon", "get_class_details"):
+            arguments["format"] = output_format
+        calls.append({"tool": kind, "arguments": arguments})
+
+    return calls
+
+
+def load_workload(path: Path) -> List[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_workload(path: Path, calls: List[Dict]):
+    with open(path, 'w', encoding='utf-8') as f:
+        for call in calls:
+            f.write(json.dumps(call, ensure_ascii=False) + "\n")
+
+
+def child_pids() -> Set[int]:
+    """PIDs of processes started by this process"""
+    if psutil:
+        return {child.pid for child in psutil.Process().children(recursive=True)}
+
+    pids = set()
+    for stat_file in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            # Fields after the "(comm)" part: state, ppid, ...
+            fields = stat_file.read_text().rsplit(')', 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        if int(fields[1]) == os.getpid():
+            pids.add(int(stat_file.parent.name))
+    return pids
+
+
+def read_rss(pid: int) -> int:
+    """Resident set size of pid in bytes, 0 if unavailable"""
+    if psutil:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+
+    try:
+        with open(f"/proc/{pid}/status", 'r') as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_port(port: int, timeout: float = 30.0):
+    """Wait until the HTTP server accepts connections"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"Server did not start listening on port {port}")
+
+
+@contextlib.asynccontextmanager
+async def stdio_session(pids: Set[int]):
+    """Start one stdio server process and open a session on it"""
+    before = child_pids()
+    params = StdioServerParameters(command=sys.executable, args=[str(SERVER_PATH)], cwd=str(SERVER_PATH.parent))
+
+    with open(os.devnull, 'w') as errlog:
+        async with stdio_client(params, errlog=errlog) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                pids.update(child_pids() - before)
+                yield session
+
+
+@contextlib.asynccontextmanager
+async def http_session(url: str):
+    """Open a session on a running HTTP server"""
+    async with streamablehttp_client(url) as (read_stream, write_stream, _):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            yield session
+
+
+def is_not_found(message: str) -> bool:
+    """Whether a failure is a lookup miss, e.g. the deliberate misspellings of the synthetic mix"""
+    return "not found" in message.lower()
+
+
+async def execute(session: ClientSession, call: Dict) -> Dict:
+    """Run one call, returning its operation, latency, response size and failure flags"""
+    start = time.perf_counter()
+    failure = None
+    try:
+        if "resource" in call:
+            operation = "read_resource"
+            result = await session.read_resource(call["resource"])
+            texts = [getattr(content, "text", "") for content in result.contents]
+        else:
+            operation = call["tool"]
+            result = await session.call_tool(call["tool"], call.get("arguments", {}))
+            texts = [getattr(content, "text", "") for content in result.content]
+            failure = next((text for text in texts if text.lstrip("{ \n").startswith('"error"')), None)
+            if result.isError and failure is None:
+                failure = "".join(texts) or "tool error"
+    except Exception as e:
+        logger.debug(f"Call failed: {call}: {e}")
+        operation = call.get("tool", "read_resource")
+        texts = []
+        failure = str(e) or type(e).__name__
+
+    not_found = failure is not None and is_not_found(failure)
+    return {
+        "operation": operation,
+        "latency": time.perf_counter() - start,
+        "bytes": sum(len(text.encode('utf-8')) for text in texts),
+        "not_found": not_found,
+        "error": failure is not None and not not_found,
+    }
+
+
+async def run_client(session: ClientSession, queue: asyncio.Queue, concurrency: int, samples: List[Dict]):
+    """Drain the shared queue with concurrency requests in flight on one session"""
+    async def worker():
+        while True:
+            try:
+                call = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            samples.append(await execute(session, call))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def sample_rss(pids: Set[int], interval: float, started: float, rss: List[List[float]]):
+    """Record total server RSS in MiB every interval seconds until cancelled"""
+    while True:
+        total = sum(read_rss(pid) for pid in list(pids))
+        if total:
+            rss.append([round(time.perf_counter() - started, 3), round(total / 1024 / 1024, 1)])
+        await asyncio.sleep(interval)
+
+
+async def run(args: argparse.Namespace) -> Dict:
+    """Launch the server(s), replay the workload and summarize the results"""
+    pids: Set[int] = set()
+    samples: List[Dict] = []
+    rss: List[List[float]] = []
+
+    async with contextlib.AsyncExitStack() as stack:
+        if args.transport == "http":
+            url = args.url
+            if url:
+                logger.info("Server RSS is not sampled for an external server (--url)")
+            else:
+                port = free_port()
+                process = subprocess.Popen(
+                    [sys.executable, str(SERVER_PATH), "--transport", "http", "--port", str(port)],
+                    cwd=str(SERVER_PATH.parent),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                stack.callback(process.wait)
+                stack.callback(process.terminate)
+                pids.add(process.pid)
+                await wait_for_port(port)
+                url = f"http://127.0.0.1:{port}/mcp"
+            sessions = [await stack.enter_async_context(http_session(url)) for _ in range(args.clients)]
+        else:
+            sessions = [await stack.enter_async_context(stdio_session(pids)) for _ in range(args.clients)]
+
+        if args.workload:
+            calls = load_workload(Path(args.workload))
+        else:
+            resources = await sessions[0].list_resources()
+            namespaces = [str(resource.uri).replace("rhino://", "") for resource in resources.resources]
+            calls = synthetic_workload(args.requests, parse_mix(args.mix), namespaces, args.format, args.seed)
+            if args.record:
+                save_workload(Path(args.record), calls)
+
+        queue = asyncio.Queue()
+        for call in calls:
+            queue.put_nowait(call)
+
+        started = time.perf_counter()
+        sampler = asyncio.create_task(sample_rss(pids, args.sample_interval, started, rss))
+        await asyncio.gather(*(run_client(session, queue, args.concurrency, samples) for session in sessions))
+        duration = time.perf_counter() - started
+        sampler.cancel()
+
+        if pids:
+            rss.append([round(duration, 3), round(sum(read_rss(pid) for pid in pids) / 1024 / 1024, 1)])
+
+    return summarize(args, samples, duration, rss)
+
+
+def summarize(args: argparse.Namespace, samples: List[Dict], duration: float, rss: List[List[float]]) -> Dict:
+    """Build the report dict from per-call samples"""
+    def latency_ms(group: List[Dict]) -> Dict[str, float]:
+        latencies = [sample["latency"] * 1000 for sample in group]
+        return {
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "max": round(max(latencies, default=0.0), 2),
+        }
+
+    operations = {}
+    for sample in samples:
+        operations.setdefault(sample["operation"], []).append(sample)
+
+    sizes = [sample["bytes"] for sample in samples]
+    rss_values = [mb for _, mb in rss]
+
+    report = {
+        "config": {
+            "transport": args.transport,
+            "clients": args.clients,
+            "concurrency": args.concurrency,
+            "workload": args.workload or f"synthetic:{args.mix}",
+            "format": args.format,
+        },
+        "requests": len(samples),
+        "not_found": sum(sample["not_found"] for sample in samples),
+        "errors": sum(sample["error"] for sample in samples),
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(samples) / duration, 1) if duration else 0.0,
+        "latency_ms": latency_ms(samples),
+        "response_bytes": {
+            "mean": round(sum(sizes) / len(sizes)) if sizes else 0,
+            "p95": percentile(sizes, 95),
+            "max": max(sizes, default=0),
+            "total": sum(sizes),
+        },
+        "by_operation": {
+            operation: {
+                "count": len(group),
+                "not_found": sum(sample["not_found"] for sample in group),
+                "errors": sum(sample["error"] for sample in group),
+                "latency_ms": latency_ms(group),
+                "mean_bytes": round(sum(sample["bytes"] for sample in group) / len(group)),
+            }
+            for operation, group in sorted(operations.items())
+        },
+    }
+    # Omitted when no server process is known, e.g. with --url
+    if rss:
+        report["rss_mb"] = {
+            "start": rss_values[0],
+            "peak": max(rss_values),
+            "end": rss_values[-1],
+            "samples": rss,
+        }
+    return report
+
+
+def print_report(report: Dict, baseline: Optional[Dict] = None):
+    """Log the report, with changes against baseline when given"""
+    def change(path: List[str]) -> str:
+        if not baseline:
+            return ""
+        old, new = baseline, report
+        for key in path:
+            old, new = old.get(key, {}), new.get(key, {})
+        if not isinstance(old, (int, float)) or not old:
+            return ""
+        return f"  (was {old}, {(new - old) / old * 100:+.1f}%)"
+
+    config = report["config"]
+    logger.info(f"{config['transport']}: {config['clients']} clients x {config['concurrency']} in flight, "
+                f"{report['requests']} requests in {report['duration_s']}s, "
+                f"{report['not_found']} not found, {report['errors']} errors{change(['errors'])}")
+    logger.info(f"  throughput: {report['throughput_rps']} req/s{change(['throughput_rps'])}")
+    for pct in ("p50", "p95", "p99"):
+        logger.info(f"  {pct}: {report['latency_ms'][pct]} ms{change(['latency_ms', pct])}")
+    logger.info(f"  response bytes: mean {report['response_bytes']['mean']}, "
+                f"p95 {report['response_bytes']['p95']}, max {report['response_bytes']['max']}"
+                f"{change(['response_bytes', 'mean'])}")
+    if "rss_mb" in report:
+        logger.info(f"  server RSS: peak {report['rss_mb']['peak']} MiB{change(['rss_mb', 'peak'])}")
+
+    for operation, stats in report["by_operation"].items():
+        logger.info(f"  {operation}: {stats['count']} calls, p50 {stats['latency_ms']['p50']} ms, "
+                    f"p99 {stats['latency_ms']['p99']} ms, {stats['mean_bytes']} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MCP server load-test harness')
+    parser.add_argument('--transport', choices=['stdio', 'http'], default='stdio',
+                       help='stdio: one server process per client, http: one shared server')
+    parser.add_argument('--url', help='Use an already running HTTP server instead of launching one')
+    parser.add_argument('--clients', type=int, default=1, help='Client sessions')
+    parser.add_argument('--concurrency', type=int, default=4, help='Requests in flight per session')
+    parser.add_argument('--requests', type=int, default=200, help='Synthetic calls in total')
+    parser.add_argument('--workload', help='Replay calls from a JSON lines file')
+    parser.add_argument('--record', help='Save the synthetic workload to a JSON lines file')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='Synthetic operation weights')
+    parser.add_argument('--format', choices=['json', 'markdown'], help='Output format for synthetic calls')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic workload seed')
+    parser.add_argument('--sample-interval', type=float, default=0.5, help='Seconds between RSS samples')
+    parser.add_argument('--output', help='Write the report as JSON')
+    parser.add_argument('--compare', help='Earlier JSON report to compare against')
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Report saved: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""Measure memory held by the loaded documentation corpus
+
+Compares every namespace file loaded as plain json.load dicts against the
+slotted server model (server/models.py).
+
+    python scripts/measure_memory.py --version 8
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+
+from models import NamespaceDoc  # noqa: E402
+
+
+def measure(paths, load) -> int:
+    """Bytes still allocated after loading every path with load()"""
+    gc.collect()
+    tracemalloc.start()
+    loaded = [load(path) for path in paths]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return size
+
+
+def load_dict(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_model(path: Path):
+    return NamespaceDoc(load_dict(path))
+
+
+def is_namespace_file(path: Path) -> bool:
+    """Namespace files have top-level classes, the corpus-wide index files do not"""
+    data = load_dict(path)
+    return isinstance(data, dict) and "classes" in data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure corpus memory usage')
+    parser.add_argument('--version', default='8', help='Rhino version')
+    parser.add_argument('--docs', default=str(PROJECT_ROOT / "docs"), help='Docs directory')
+    args = parser.parse_args()
+    
+    docs_path = Path(args.docs) / f"v{args.version}"
+    paths = sorted(p for p in docs_path.glob('*.json') if is_namespace_file(p))
+    if not paths:
+        print(f"No namespace files in {docs_path}")
+        return
+    
+    dict_bytes = measure(paths, load_dict)
+    model_bytes = measure(paths, load_model)
+    
+    print(f"Namespaces:  {len(paths)}")
+    print(f"json dicts:  {dict_bytes / 1024 / 1024:.1f} MiB")
+    print(f"models:      {model_bytes / 1024 / 1024:.1f} MiB")
+    print(f"saved:       {(1 - model_bytes / dict_bytes) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
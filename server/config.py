@@ -12,6 +12,13 @@ DEFAULT_VERSION = "8"
 # Server settings
 CACHE_ENABLED = True
 CACHE_SIZE = 100  # Number of documents to cache
+RESULT_CACHE_SIZE = 1024  # Number of search results to memoize
+CORPUS_CHECK_INTERVAL = 5.0  # Seconds between checks for a rebuilt corpus
+
+# HTTP transport (python mcp_server.py --transport http)
+HTTP_HOST = "127.0.0.1"
+HTTP_PORT = 8765
+MAX_CONCURRENT_REQUESTS = 8  # Per client connection
 
 # Logging
 LOG_LEVEL = "INFO"
\ No newline at end of file
@@ -1,21 +1,74 @@
 """Document search and retrieval service"""
 
 import json
+import threading
+import time
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple, Union
 import logging
 
+import formatting
+from models import ClassDoc, MemberDoc, NamespaceDoc
+from symbol_index import SymbolIndex
+from utils import ResultCache
+
 logger = logging.getLogger(__name__)
 
+# Member lists of a class record and the result type they map to
+MEMBER_KINDS = {"methods": "method", "properties": "property", "fields": "field"}
+
 
 class DocsService:
     """Service for searching and retrieving RhinoCommon documentation"""
     
-    def __init__(self, docs_path: Path, version: str = "8"):
+    def __init__(self, docs_path: Path, version: str = "8", cache_size: int = 1024,
+                 check_interval: float = 5.0):
         self.docs_path = docs_path / f"v{version}"
         self.version = version
         self.cache = {}
+        self.results = ResultCache(cache_size)
+        self.check_interval = check_interval
+        self.generation = self._corpus_generation()
+        self._checked_at = time.monotonic()
+        self._reload_lock = threading.Lock()
         self.index = self._load_index()
+        self.ids = None
+        self._graph = None  # (graph, short name map), see _load_graph()
+        self.symbols = None
+    
+    def _corpus_generation(self) -> Optional[Tuple[int, int]]:
+        """Identify the corpus on disk by index.json, which the scraper writes last"""
+        try:
+            stat = (self.docs_path / "index.json").stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _check_generation(self):
+        """Drop everything loaded from disk if the corpus was rebuilt since"""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        
+        with self._reload_lock:
+            if now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            
+            generation = self._corpus_generation()
+            if generation == self.generation:
+                return
+            
+            logger.info(f"Corpus changed on disk, reloading: {self.docs_path}")
+            # Each lazily loaded structure is reset with a single assignment, the
+            # generation is published last so no cache key pairs it with stale data
+            self.cache = {}
+            self.ids = None
+            self._graph = None
+            self.symbols = None
+            self.index = self._load_index()
+            self.results.clear()
+            self.generation = generation
     
     def _load_index(self) -> Dict:
         """Load documentation index"""
@@ -25,25 +78,134 @@ class DocsService:
                 return json.load(f)
         return {"namespaces": [], "version": self.version}
     
-    def _load_namespace(self, namespace: str) -> Optional[Dict]:
+    def _load_ids(self) -> Dict:
+        """Load documentation ID index (ids.json written by the XML parser)
+        
+        Like the other loaders, reads the attribute once, a reload may reset it
+        from another thread at any time.
+        """
+        ids = self.ids
+        if ids is not None:
+            return ids
+        
+        ids_file = self.docs_path / "ids.json"
+        if ids_file.exists():
+            with open(ids_file, 'r', encoding='utf-8') as f:
+                ids = json.load(f)
+        else:
+            logger.warning(f"ID index not found: {ids_file}")
+            ids = {}
+        
+        self.ids = ids
+        return ids
+    
+    def _load_symbols(self) -> SymbolIndex:
+        """Load symbol table for name completion (symbols.json written by the XML parser)"""
+        symbols = self.symbols
+        if symbols is not None:
+            return symbols
+        
+        symbols_file = self.docs_path / "symbols.json"
+        if symbols_file.exists():
+            with open(symbols_file, 'r', encoding='utf-8') as f:
+                symbols = SymbolIndex(json.load(f))
+        else:
+            logger.warning(f"Symbol table not found: {symbols_file}")
+            symbols = SymbolIndex({})
+        
+        self.symbols = symbols
+        return symbols
+    
+    def _load_graph(self) -> Tuple[Dict, Dict[str, List[str]]]:
+        """Load type cross-reference graph (graph.json written by the XML parser)
+        
+        Returns (graph, short name -> full names). Both are built locally and
+        published in one assignment, so concurrent callers never see one
+        without the other.
+        """
+        loaded = self._graph
+        if loaded is not None:
+            return loaded
+        
+        graph_file = self.docs_path / "graph.json"
+        if graph_file.exists():
+            with open(graph_file, 'r', encoding='utf-8') as f:
+                graph = json.load(f)
+        else:
+            logger.warning(f"Type graph not found: {graph_file}")
+            graph = {}
+        
+        # Short name -> full names, e.g. "brep" -> ["Rhino.Geometry.Brep"]
+        graph_types = {}
+        for relation in graph.values():
+            for type_name in relation:
+                short_name = type_name.rsplit('.', 1)[-1].lower()
+                names = graph_types.setdefault(short_name, [])
+                if type_name not in names:
+                    names.append(type_name)
+        
+        loaded = (graph, graph_types)
+        self._graph = loaded
+        return loaded
+    
+    def _resolve_type(self, type_name: str, graph: Dict, graph_types: Dict[str, List[str]]) -> List[str]:
+        """Resolve a short or qualified type name to graph keys"""
+        if any(type_name in relation for relation in graph.values()):
+            return [type_name]
+        return graph_types.get(type_name.rsplit('.', 1)[-1].lower(), [])
+    
+    def _load_namespace(self, namespace: str) -> Optional[NamespaceDoc]:
         """Load namespace documentation"""
-        if namespace in self.cache:
-            return self.cache[namespace]
+        cache = self.cache
+        data = cache.get(namespace)
+        if data is not None:
+            return data
         
         filename = namespace.replace('.', '_') + '.json'
         filepath = self.docs_path / filename
         
         if filepath.exists():
             with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.cache[namespace] = data
+                data = NamespaceDoc(json.load(f))
+                cache[namespace] = data
                 return data
         
         logger.warning(f"Namespace not found: {namespace}")
         return None
     
     def search(self, query: str, namespace: Optional[str] = None) -> List[Dict]:
-        """Search API by query string"""
+        """Search API by query string
+        
+        Results are cached per corpus generation and shared between callers,
+        concurrent identical searches run only once.
+        """
+        self._check_generation()
+        query, namespace = self._normalize_query(query, namespace)
+        
+        key = ("search", self.version, self.generation, query.lower(), namespace)
+        return self.results.get_or_compute(key, lambda: self._search(query, namespace))
+    
+    def search_markdown(self, query: str, namespace: Optional[str] = None) -> str:
+        """Search results rendered as compact Markdown, cached like search()
+        
+        Only the result lines are cached: the key ignores case, so the heading
+        with the caller's own query is added per call.
+        """
+        results = self.search(query, namespace)
+        query, namespace = self._normalize_query(query, namespace)
+        
+        key = ("search_markdown", self.version, self.generation, query.lower(), namespace)
+        lines = self.results.get_or_compute(
+            key, lambda: "".join(formatting.search_result_lines(results))
+        )
+        return formatting.search_heading(query, namespace, len(results)) + lines
+    
+    def _normalize_query(self, query: str, namespace: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Collapse whitespace in query and lowercase namespace, for cache keys"""
+        return " ".join(query.split()), namespace.lower() if namespace else None
+    
+    def _search(self, query: str, namespace: Optional[str] = None) -> List[Dict]:
+        """Search all classes and methods for query, uncached"""
         results = []
         query_lower = query.lower()
         
@@ -54,8 +216,8 @@ class DocsService:
             if not data:
                 continue
             
-            for cls in data.get("classes", []):
-                class_name = cls.get("name", "")
+            for cls in data.classes:
+                class_name = cls.name
                 
                 # Match class name
                 if query_lower in class_name.lower():
@@ -63,26 +225,28 @@ class DocsService:
                         "type": "class",
                         "namespace": ns,
                         "name": class_name,
-                        "description": cls.get("description", "")[:200],
-                        "url": cls.get("url", "")
+                        "description": cls.description[:200],
+                        "url": cls.url
                     })
                 
                 # Match methods
-                for method in cls.get("methods", []):
-                    if query_lower in method.get("name", "").lower():
+                for method in cls.methods:
+                    if query_lower in method.name.lower():
                         results.append({
                             "type": "method",
+                            "id": method.id,
                             "class": class_name,
                             "namespace": ns,
-                            "name": method.get("name", ""),
-                            "signature": method.get("signature", ""),
-                            "description": method.get("description", "")[:200]
+                            "name": method.name,
+                            "signature": method.signature,
+                            "description": method.description[:200]
                         })
         
         return results
     
-    def get_class_info(self, class_name: str, namespace: Optional[str] = None) -> Optional[Dict]:
+    def get_class_info(self, class_name: str, namespace: Optional[str] = None) -> Optional[ClassDoc]:
         """Get detailed class information"""
+        self._check_generation()
         namespaces = [namespace] if namespace else self.index.get("namespaces", [])
         
         for ns in namespaces:
@@ -90,12 +254,131 @@ class DocsService:
             if not data:
                 continue
             
-            for cls in data.get("classes", []):
-                if cls.get("name", "").lower() == class_name.lower():
+            for cls in data.classes:
+                if cls.name.lower() == class_name.lower():
                     return cls
         
         return None
     
+    def class_markdown(self, cls: ClassDoc) -> str:
+        """Class rendered as compact Markdown, cached per corpus generation"""
+        key = ("class_markdown", self.version, self.generation, cls.full_name or cls.name)
+        return self.results.get_or_compute(
+            key, lambda: "".join(formatting.class_markdown(cls, cls.full_name.rpartition('.')[0]))
+        )
+    
+    def namespace_markdown(self, namespace: str) -> Optional[str]:
+        """Whole namespace rendered as compact Markdown, cached per corpus generation"""
+        self._check_generation()
+        data = self._load_namespace(namespace)
+        if not data:
+            return None
+        
+        key = ("namespace_markdown", self.version, self.generation, namespace)
+        return self.results.get_or_compute(key, lambda: "".join(formatting.namespace_markdown(data)))
+    
+    def get_member(self, member_id: str) -> Optional[Union[ClassDoc, MemberDoc]]:
+        """Get a single class or member record by its documentation ID
+        
+        e.g. "M:Rhino.Geometry.Brep.CreateFromLoft(System.Collections.Generic.IEnumerable{Rhino.Geometry.Curve},...)"
+        """
+        self._check_generation()
+        location = self._load_ids().get(member_id)
+        if not location:
+            return None
+        
+        namespace, class_pos, kind, member_pos = location
+        data = self._load_namespace(namespace)
+        if not data:
+            return None
+        
+        # ids.json and the namespace file can come from different generations
+        # while a rebuild is in progress, so positions are only trusted if the
+        # record they point at carries the requested ID
+        try:
+            cls = data.classes[class_pos]
+            record = cls if kind == "class" else getattr(cls, kind)[member_pos]
+        except IndexError:
+            return None
+        return record if record.id == member_id else None
+    
+    def list_overloads(self, class_name: str, member_name: str,
+                       namespace: Optional[str] = None) -> List[Dict]:
+        """List overload stubs of a class member, addressable by get_member()"""
+        cls = self.get_class_info(class_name, namespace)
+        if not cls:
+            return []
+        
+        stubs = []
+        member_lower = member_name.lower()
+        for kind, member_type in MEMBER_KINDS.items():
+            for member in getattr(cls, kind):
+                if member.name.lower() == member_lower:
+                    stubs.append({
+                        "id": member.id,
+                        "type": member_type,
+                        "signature": member.signature or member.name,
+                        "description": member.description[:200]
+                    })
+        
+        return stubs
+    
+    def complete_symbol(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """Complete a class or member name prefix, e.g. "NurbsS" or "Brep.CreateFr"""
+        self._check_generation()
+        return self._load_symbols().complete(prefix, limit)
+    
+    def suggest_symbols(self, name: str, limit: int = 5) -> List[Dict]:
+        """Closest class and member names to one that was not found"""
+        self._check_generation()
+        return self._load_symbols().suggest(name, limit)
+    
+    def find_members(self, returns: Optional[str] = None, accepts: Optional[str] = None,
+                     references: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """Find members by the types they return, accept or reference
+        
+        Every given criterion must match, so returns="Brep", accepts="Curve"
+        answers "what produces a Brep from Curves?".
+        """
+        self._check_generation()
+        graph, graph_types = self._load_graph()
+        criteria = {"returns": returns, "accepts": accepts, "references": references}
+        
+        member_ids = None
+        for relation, type_name in criteria.items():
+            if not type_name:
+                continue
+            
+            matches = set()
+            for full_name in self._resolve_type(type_name, graph, graph_types):
+                matches.update(graph.get(relation, {}).get(full_name, []))
+            
+            member_ids = matches if member_ids is None else member_ids & matches
+        
+        if not member_ids:
+            return []
+        
+        return [self._describe_member_id(member_id) for member_id in sorted(member_ids)[:limit]]
+    
+    def _describe_member_id(self, member_id: str) -> Dict:
+        """Split a documentation ID into kind, class and member name"""
+        kinds = {"T": "class", "M": "method", "P": "property", "F": "field"}
+        prefix, _, full_name = member_id.partition(':')
+        
+        if prefix == "T":
+            namespace, _, name = full_name.rpartition('.')
+            return {"id": member_id, "type": "class", "namespace": namespace.lower(), "name": name}
+        
+        class_full_name, _, name = full_name.split('(')[0].rpartition('.')
+        namespace, _, class_name = class_full_name.rpartition('.')
+        return {
+            "id": member_id,
+            "type": kinds.get(prefix, prefix),
+            "namespace": namespace.lower(),
+            "class": class_name,
+            "name": name
+        }
+    
     def get_examples(self, class_name: str) -> List[Dict]:
         """Get code examples for a class"""
         examples_dir = self.docs_path.parent / "examples"
@@ -109,4 +392,14 @@ class DocsService:
     
     def list_namespaces(self) -> List[str]:
         """List all available namespaces"""
-        return self.index.get("namespaces", [])
\ No newline at end of file
+        self._check_generation()
+        return self.index.get("namespaces", [])
+    
+    def cache_stats(self) -> Dict:
+        """Report result cache hit rates and loaded corpus state"""
+        return {
+            "version": self.version,
+            "generation": self.generation,
+            "namespaces_loaded": len(self.cache),
+            "results": self.results.stats()
+        }
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""Compact Markdown rendering for MCP responses
+
+Markdown costs agents far fewer tokens than indented JSON. Renderers yield
+chunks so large namespaces are never built up by repeated concatenation.
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional
+
+from models import ClassDoc, MemberDoc, NamespaceDoc
+
+# Namespace qualifiers inside doc ID types, e.g. "System.Collections.Generic." in "System.Collections.Generic.IEnumerable{...}"
+QUALIFIER_PATTERN = re.compile(r'\b(?:[A-Za-z_]\w*\.)+(?=[A-Za-z_])')
+
+
+def short_type(type_name: str) -> str:
+    """Drop namespaces from a doc ID type: IEnumerable{Rhino.Geometry.Curve} -> IEnumerable{Curve}"""
+    return QUALIFIER_PATTERN.sub('', type_name).replace('@', '&')
+
+
+def id_parameters(member_id: str) -> List[str]:
+    """Short parameter types of a doc ID: "M:A.F(System.Int32,Rhino.Geometry.Point3d)" -> ["Int32", "Point3d"]"""
+    # Conversion operators end in "~ReturnType" after the parameter list
+    _, paren, params = member_id.rpartition(')')[0].partition('(')
+    if not params:
+        return []
+    
+    parts = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(params):
+        if char in '{[':
+            depth += 1
+        elif char in '}]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            # Commas inside generics and array bounds, e.g. Double[0:,0:], are not separators
+            parts.append(params[start:i])
+            start = i + 1
+    parts.append(params[start:])
+    return [short_type(part) for part in parts]
+
+
+def member_line(member: MemberDoc) -> str:
+    """One bullet per member: name, parameters, return type and summary"""
+    line = f"- `{member.name}"
+    if member.kind == "methods" or member.parameters:
+        params = ", ".join(
+            f"{short_type(p.type)} {p.name}".strip() if p.type else p.name
+            for p in member.parameters
+        )
+        line += f"({params})"
+    if member.returns_type:
+        line += f" → {short_type(member.returns_type)}"
+    line += "`"
+    if member.description:
+        line += f" — {member.description}"
+    return line + "\n"
+
+
+def class_markdown(cls: ClassDoc, namespace: Optional[str] = None) -> Iterator[str]:
+    """Yield Markdown for one class with all of its members"""
+    heading = f"## {cls.name}"
+    if namespace:
+        heading += f" ({namespace})"
+    yield heading + "\n\n"
+    
+    if cls.description:
+        yield f"{cls.description}\n\n"
+    if cls.remarks:
+        yield f"{cls.remarks}\n\n"
+    
+    for title, members in (("Methods", cls.methods), ("Properties", cls.properties), ("Fields", cls.fields)):
+        if not members:
+            continue
+        yield f"### {title} ({len(members)})\n\n"
+        for member in members:
+            yield member_line(member)
+        yield "\n"
+
+
+def namespace_markdown(data: NamespaceDoc) -> Iterator[str]:
+    """Yield Markdown for a whole namespace, class by class"""
+    yield f"# {data.namespace}\n\n"
+    for cls in data.classes:
+        yield from class_markdown(cls)
+
+
+def search_heading(query: str, namespace: Optional[str], count: int) -> str:
+    """Heading line of a search answer"""
+    scope = f" in {namespace}" if namespace else ""
+    return f"# Search: {query}{scope} ({count} results)\n\n"
+
+
+def search_markdown(query: str, namespace: Optional[str], results: List[Dict]) -> Iterator[str]:
+    """Yield Markdown for search results, one line per match"""
+    yield search_heading(query, namespace, len(results))
+    yield from search_result_lines(results)
+
+
+def search_result_lines(results: List[Dict]) -> Iterator[str]:
+    """Yield one line per search match, methods with their parameter types and doc ID"""
+    for result in results:
+        if result["type"] == "class":
+            yield f"- **{result['name']}** ({result['namespace']})"
+        else:
+            line = f"- `{result['class']}.{result['name']}"
+            if result.get("id"):
+                line += f"({', '.join(id_parameters(result['id']))})"
+            yield line + f"` ({result['namespace']})"
+        if result.get("description"):
+            yield f" — {result['description']}"
+        if result.get("id"):
+            yield f" · `{result['id']}`"
+        yield "\n"
\ No newline at end of file
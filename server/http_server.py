@@ -0,0 +1,77 @@
+"""HTTP transports for serving many MCP clients from one process"""
+
+import contextlib
+import logging
+from typing import Callable, Dict, Optional
+
+import uvicorn
+from mcp.server import Server
+from mcp.server.sse import SseServerTransport
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Mount, Route
+
+logger = logging.getLogger(__name__)
+
+
+class StreamableHTTPApp:
+    """ASGI app handing requests to the session manager
+    
+    Used as a Route endpoint so /mcp itself is served; a Mount only matches
+    /mcp/... and answers /mcp with a redirect.
+    """
+    
+    def __init__(self, session_manager: StreamableHTTPSessionManager):
+        self.session_manager = session_manager
+    
+    async def __call__(self, scope, receive, send):
+        await self.session_manager.handle_request(scope, receive, send)
+
+
+def create_http_app(app: Server, stats: Optional[Callable[[], Dict]] = None) -> Starlette:
+    """Create an ASGI app exposing the MCP server over HTTP
+    
+    - /mcp: streamable HTTP transport
+    - /sse, /messages/: SSE transport for older clients
+    - /stats: JSON from stats(), e.g. cache hit rates
+    
+    Every connection runs against the same Server, and so the same DocsService.
+    """
+    session_manager = StreamableHTTPSessionManager(app=app)
+    sse = SseServerTransport("/messages/")
+    
+    async def handle_sse(request: Request) -> Response:
+        async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+        return Response()
+    
+    async def handle_stats(request: Request) -> Response:
+        return JSONResponse(stats() if stats else {})
+    
+    @contextlib.asynccontextmanager
+    async def lifespan(_: Starlette):
+        async with session_manager.run():
+            logger.info("HTTP session manager started")
+            yield
+    
+    return Starlette(
+        routes=[
+            Route("/mcp", endpoint=StreamableHTTPApp(session_manager)),
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            Mount("/messages/", app=sse.handle_post_message),
+            Route("/stats", endpoint=handle_stats, methods=["GET"]),
+        ],
+        lifespan=lifespan
+    )
+
+
+async def run_http_server(app: Server, host: str, port: int, log_level: str = "info",
+                          stats: Optional[Callable[[], Dict]] = None):
+    """Serve the MCP server over HTTP until interrupted"""
+    http_app = create_http_app(app, stats)
+    server = uvicorn.Server(uvicorn.Config(http_app, host=host, port=port, log_level=log_level))
+    
+    logger.info(f"Listening on http://{host}:{port}/mcp (SSE: /sse)")
+    await server.serve()
\ No newline at end of file
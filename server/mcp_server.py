@@ -1,16 +1,20 @@
 """MCP Server for RhinoCommon documentation"""
 
+import argparse
 import asyncio
 import json
 import logging
 from typing import Any, Sequence
 from pathlib import Path
+from urllib.parse import parse_qs
 
 import mcp.types as types
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
 from docs_service import DocsService
+from models import to_json
+from utils import ConnectionLimiter
 import config
 
 # Setup logging
@@ -22,7 +26,25 @@ logger = logging.getLogger(__name__)
 
 # Initialize server and service
 app = Server("rhinocommon")
-docs_service = DocsService(config.DOCS_DIR, config.DEFAULT_VERSION)
+docs_service = DocsService(
+    config.DOCS_DIR,
+    config.DEFAULT_VERSION,
+    cache_size=config.RESULT_CACHE_SIZE if config.CACHE_ENABLED else 0,
+    check_interval=config.CORPUS_CHECK_INTERVAL
+)
+limiter = ConnectionLimiter(config.MAX_CONCURRENT_REQUESTS)
+
+# Output format option shared by tools that can answer in Markdown
+FORMAT_PROPERTY = {
+    "type": "string",
+    "enum": ["json", "markdown"],
+    "description": "Optional: 'markdown' for a compact, token-efficient answer (default 'json')"
+}
+
+
+def session_limit() -> asyncio.Semaphore:
+    """Semaphore capping in-flight requests for the current client session"""
+    return limiter.for_session(app.request_context.session)
 
 
 @app.list_resources()
@@ -36,7 +58,7 @@ async def list_resources() -> list[types.Resource]:
                 uri=f"rhino://{namespace}",
                 name=f"{namespace} Documentation",
                 mimeType="application/json",
-                description=f"RhinoCommon {namespace} API reference"
+                description=f"RhinoCommon {namespace} API reference (append ?format=markdown for compact Markdown)"
             )
         )
     
@@ -46,18 +68,34 @@ async def list_resources() -> list[types.Resource]:
 
 @app.read_resource()
 async def read_resource(uri: str) -> str:
-    """Read resource content"""
+    """Read resource content, e.g. rhino://rhino.geometry or rhino://rhino.geometry?format=markdown"""
+    async with session_limit():
+        return await _read_resource(str(uri))
+
+
+async def _read_resource(uri: str) -> str:
+    """Read resource content, loading and serializing in worker threads"""
     if not uri.startswith("rhino://"):
         raise ValueError(f"Invalid URI scheme: {uri}")
     
-    namespace = uri.replace("rhino://", "")
-    data = docs_service._load_namespace(namespace)
+    namespace, _, query = uri.replace("rhino://", "").partition("?")
+    output_format = parse_qs(query).get("format", ["json"])[0]
+    
+    if output_format == "markdown":
+        text = await asyncio.to_thread(docs_service.namespace_markdown, namespace)
+        if text is None:
+            raise ValueError(f"Namespace not found: {namespace}")
+        
+        logger.info(f"Read resource: {namespace} (markdown)")
+        return text
+    
+    data = await asyncio.to_thread(docs_service._load_namespace, namespace)
     
     if not data:
         raise ValueError(f"Namespace not found: {namespace}")
     
     logger.info(f"Read resource: {namespace}")
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    return await asyncio.to_thread(json.dumps, data, indent=2, ensure_ascii=False, default=to_json)
 
 
 @app.list_tools()
@@ -77,11 +115,30 @@ async def list_tools() -> list[types.Tool]:
                     "namespace": {
                         "type": "string",
                         "description": "Optional: limit search to specific namespace (e.g., 'rhino.geometry')"
-                    }
+                    },
+                    "format": FORMAT_PROPERTY
                 },
                 "required": ["query"]
             }
         ),
+        types.Tool(
+            name="complete_symbol",
+            description="Autocomplete a RhinoCommon class or member name from its beginning (e.g. 'NurbsS', 'Brep.CreateFr'). Returns the top matches ranked by how often they are used, shortest first.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "prefix": {
+                        "type": "string",
+                        "description": "Beginning of a class name, member name, or Class.Member"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Optional: maximum number of completions (default 10, max 50)"
+                    }
+                },
+                "required": ["prefix"]
+            }
+        ),
         types.Tool(
             name="get_class_details",
             description="Get complete information about a specific RhinoCommon class including all methods, properties, and constructors.",
@@ -95,11 +152,62 @@ async def list_tools() -> list[types.Tool]:
                     "namespace": {
                         "type": "string",
                         "description": "Optional: namespace hint to speed up search"
-                    }
+                    },
+                    "format": FORMAT_PROPERTY
                 },
                 "required": ["class_name"]
             }
         ),
+        types.Tool(
+            name="get_member",
+            description="Get one RhinoCommon member overload by its documentation ID (e.g. 'M:Rhino.Geometry.Brep.CreateFromLoft(...)'), or list the overloads of class_name.member_name as short stubs with their IDs. Much smaller than get_class_details.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "member_id": {
+                        "type": "string",
+                        "description": "Full documentation ID, as returned in the 'id' field of other tools"
+                    },
+                    "class_name": {
+                        "type": "string",
+                        "description": "Class name, used with member_name to list overloads (e.g., 'Brep')"
+                    },
+                    "member_name": {
+                        "type": "string",
+                        "description": "Member name, used with class_name (e.g., 'CreateFromLoft')"
+                    },
+                    "namespace": {
+                        "type": "string",
+                        "description": "Optional: namespace hint to speed up search"
+                    }
+                }
+            }
+        ),
+        types.Tool(
+            name="find_members_by_type",
+            description="Find RhinoCommon members by the types they return, accept as parameters, or reference in their docs. Combine criteria, e.g. returns='Brep' and accepts='Curve' for members that build a Brep from curves.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "returns": {
+                        "type": "string",
+                        "description": "Optional: type the member returns (e.g., 'Brep' or 'Rhino.Geometry.Brep')"
+                    },
+                    "accepts": {
+                        "type": "string",
+                        "description": "Optional: type taken by one of the parameters (e.g., 'Curve')"
+                    },
+                    "references": {
+                        "type": "string",
+                        "description": "Optional: type linked from the member documentation"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Optional: maximum number of results (default 50)"
+                    }
+                }
+            }
+        ),
         types.Tool(
             name="get_code_examples",
             description="Get practical code examples for a RhinoCommon class showing common usage patterns.",
@@ -120,6 +228,12 @@ async def list_tools() -> list[types.Tool]:
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> Sequence[types.TextContent]:
     """Execute tool"""
+    async with session_limit():
+        return await _call_tool(name, arguments)
+
+
+async def _call_tool(name: str, arguments: Any) -> Sequence[types.TextContent]:
+    """Execute tool, service calls run in worker threads to keep the event loop free"""
     
     try:
         if name == "search_rhinocommon":
@@ -127,7 +241,12 @@ async def call_tool(name: str, arguments: Any) -> Sequence[types.TextContent]:
             namespace = arguments.get("namespace")
             
             logger.info(f"Searching: '{query}' in namespace: {namespace or 'all'}")
-            results = docs_service.search(query, namespace)
+            
+            if arguments.get("format") == "markdown":
+                text = await asyncio.to_thread(docs_service.search_markdown, query, namespace)
+                return [types.TextContent(type="text", text=text)]
+            
+            results = await asyncio.to_thread(docs_service.search, query, namespace)
             
             return [
                 types.TextContent(
@@ -141,28 +260,110 @@ async def call_tool(name: str, arguments: Any) -> Sequence[types.TextContent]:
                 )
             ]
         
+        elif name == "complete_symbol":
+            prefix = arguments.get("prefix")
+            
+            logger.info(f"Completing: '{prefix}'")
+            completions = await asyncio.to_thread(docs_service.complete_symbol, prefix, arguments.get("limit", 10))
+            
+            return [
+                types.TextContent(
+                    type="text",
+                    text=json.dumps({
+                        "prefix": prefix,
+                        "completions": completions
+                    }, indent=2, ensure_ascii=False)
+                )
+            ]
+        
         elif name == "get_class_details":
             class_name = arguments.get("class_name")
             namespace = arguments.get("namespace")
             
             logger.info(f"Getting class details: {class_name}")
-            info = docs_service.get_class_info(class_name, namespace)
+            info = await asyncio.to_thread(docs_service.get_class_info, class_name, namespace)
             
             if not info:
+                suggestions = await asyncio.to_thread(docs_service.suggest_symbols, class_name)
                 return [
                     types.TextContent(
                         type="text",
                         text=json.dumps({
                             "error": f"Class '{class_name}' not found",
+                            "did_you_mean": suggestions,
                             "suggestion": "Try searching first with search_rhinocommon"
                         }, indent=2)
                     )
                 ]
             
+            if arguments.get("format") == "markdown":
+                text = await asyncio.to_thread(docs_service.class_markdown, info)
+                return [types.TextContent(type="text", text=text)]
+            
             return [
                 types.TextContent(
                     type="text",
-                    text=json.dumps(info, indent=2, ensure_ascii=False)
+                    text=json.dumps(info, indent=2, ensure_ascii=False, default=to_json)
+                )
+            ]
+        
+        elif name == "get_member":
+            member_id = arguments.get("member_id")
+            
+            if member_id:
+                logger.info(f"Getting member: {member_id}")
+                member = await asyncio.to_thread(docs_service.get_member, member_id)
+                result = member or {
+                    "error": f"Member '{member_id}' not found",
+                    "suggestion": "List overload IDs with class_name and member_name"
+                }
+            else:
+                class_name = arguments.get("class_name")
+                member_name = arguments.get("member_name")
+                if not class_name or not member_name:
+                    raise ValueError("Provide 'member_id', or both 'class_name' and 'member_name'")
+                
+                logger.info(f"Listing overloads: {class_name}.{member_name}")
+                overloads = await asyncio.to_thread(
+                    docs_service.list_overloads, class_name, member_name, arguments.get("namespace")
+                )
+                result = {
+                    "class": class_name,
+                    "member": member_name,
+                    "overloads": overloads,
+                    "count": len(overloads)
+                }
+            
+            return [
+                types.TextContent(
+                    type="text",
+                    text=json.dumps(result, indent=2, ensure_ascii=False, default=to_json)
+                )
+            ]
+        
+        elif name == "find_members_by_type":
+            criteria = {
+                "returns": arguments.get("returns"),
+                "accepts": arguments.get("accepts"),
+                "references": arguments.get("references")
+            }
+            
+            if not any(criteria.values()):
+                raise ValueError("Provide at least one of 'returns', 'accepts' or 'references'")
+            
+            logger.info(f"Finding members by type: {criteria}")
+            results = await asyncio.to_thread(
+                docs_service.find_members, limit=arguments.get("limit", 50), **criteria
+            )
+            
+            return [
+                types.TextContent(
+                    type="text",
+                    text=json.dumps({
+                        **criteria,
+                        "results": results,
+                        "count": len(results)
+                    }, indent=2, ensure_ascii=False)
                 )
             ]
         
@@ -170,7 +371,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[types.TextContent]:
             class_name = arguments.get("class_name")
             
             logger.info(f"Getting examples for: {class_name}")
-            examples = docs_service.get_examples(class_name)
+            examples = await asyncio.to_thread(docs_service.get_examples, class_name)
             
             if not examples:
                 return [
@@ -210,19 +411,35 @@ async def call_tool(name: str, arguments: Any) -> Sequence[types.TextContent]:
         ]
 
 
-async def main():
+async def main(args: argparse.Namespace):
     """Run MCP server"""
     logger.info("Starting RhinoCommon MCP Server...")
     logger.info(f"Docs path: {docs_service.docs_path}")
     logger.info(f"Available namespaces: {len(docs_service.list_namespaces())}")
     
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    try:
+        if args.transport == "http":
+            from http_server import run_http_server
+            
+            await run_http_server(app, args.host, args.port, config.LOG_LEVEL.lower(),
+                                  stats=docs_service.cache_stats)
+            return
+        
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        logger.info(f"Cache stats: {docs_service.cache_stats()}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='RhinoCommon MCP Server')
+    parser.add_argument('--transport', choices=['stdio', 'http'], default='stdio',
+                       help='stdio (one client per process) or http (many clients share one process)')
+    parser.add_argument('--host', default=config.HTTP_HOST, help='Host for HTTP transport')
+    parser.add_argument('--port', type=int, default=config.HTTP_PORT, help='Port for HTTP transport')
+    
+    asyncio.run(main(parser.parse_args()))
\ No newline at end of file
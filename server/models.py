@@ -0,0 +1,120 @@
+"""Compact in-memory model for namespace documentation
+
+json.load gives one dict per class and member, each repeating the same keys,
+and thousands of copies of strings like "The document.". These classes use
+__slots__, interned strings and shared empty sentinels instead, and are turned
+back into dicts only while serializing (json.dumps(..., default=to_json)).
+"""
+
+import sys
+from typing import Any, Dict, Tuple
+
+EMPTY = ""
+EMPTY_TUPLE: Tuple = ()
+
+
+def _str(value: Any) -> str:
+    """Intern a string field, sharing one empty string"""
+    if not value:
+        return EMPTY
+    return sys.intern(value)
+
+
+def _strs(values: Any) -> Tuple[str, ...]:
+    """Interned tuple of strings, sharing one empty tuple"""
+    if not values:
+        return EMPTY_TUPLE
+    return tuple(_str(value) for value in values)
+
+
+class ParamDoc:
+    """Method or indexer parameter"""
+    
+    __slots__ = ("name", "type", "description")
+    
+    def __init__(self, data: Dict):
+        self.name = _str(data.get("name"))
+        self.type = _str(data.get("type"))
+        self.description = _str(data.get("description"))
+    
+    def to_dict(self) -> Dict:
+        result = {"name": self.name, "description": self.description}
+        if self.type:
+            result["type"] = self.type
+        return result
+
+
+class MemberDoc:
+    """Method, property or field of a class"""
+    
+    __slots__ = ("kind", "id", "name", "signature", "description", "parameters",
+                 "returns", "returns_type", "remarks", "value", "references")
+    
+    # Keys written by to_dict(), per member list of the class record
+    KEYS = {
+        "methods": ("id", "name", "signature", "description", "parameters",
+                    "returns", "returns_type", "remarks", "references"),
+        "properties": ("id", "name", "signature", "description", "value", "references"),
+        "fields": ("id", "name", "description", "references"),
+    }
+    
+    def __init__(self, kind: str, data: Dict):
+        self.kind = kind
+        self.id = _str(data.get("id"))
+        self.name = _str(data.get("name"))
+        self.signature = _str(data.get("signature"))
+        self.description = _str(data.get("description"))
+        self.parameters = tuple(ParamDoc(p) for p in data.get("parameters") or EMPTY_TUPLE)
+        self.returns = _str(data.get("returns"))
+        self.returns_type = _str(data.get("returns_type"))
+        self.remarks = _str(data.get("remarks"))
+        self.value = _str(data.get("value"))
+        self.references = _strs(data.get("references"))
+    
+    def to_dict(self) -> Dict:
+        result = {key: getattr(self, key) for key in self.KEYS[self.kind]}
+        # Only indexer properties have parameters
+        if self.kind == "properties" and self.parameters:
+            result["parameters"] = self.parameters
+        return result
+
+
+class ClassDoc:
+    """Class with its methods, properties and fields"""
+    
+    __slots__ = ("id", "name", "full_name", "description", "remarks",
+                 "methods", "properties", "fields", "url")
+    
+    def __init__(self, data: Dict):
+        self.id = _str(data.get("id"))
+        self.name = _str(data.get("name"))
+        self.full_name = _str(data.get("full_name"))
+        self.description = _str(data.get("description"))
+        self.remarks = _str(data.get("remarks"))
+        self.methods = tuple(MemberDoc("methods", m) for m in data.get("methods") or EMPTY_TUPLE)
+        self.properties = tuple(MemberDoc("properties", p) for p in data.get("properties") or EMPTY_TUPLE)
+        self.fields = tuple(MemberDoc("fields", f) for f in data.get("fields") or EMPTY_TUPLE)
+        self.url = _str(data.get("url"))
+    
+    def to_dict(self) -> Dict:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+class NamespaceDoc:
+    """All classes of one namespace file"""
+    
+    __slots__ = ("namespace", "classes")
+    
+    def __init__(self, data: Dict):
+        self.namespace = _str(data.get("namespace"))
+        self.classes = tuple(ClassDoc(c) for c in data.get("classes") or EMPTY_TUPLE)
+    
+    def to_dict(self) -> Dict:
+        return {"namespace": self.namespace, "classes": self.classes}
+
+
+def to_json(obj: Any) -> Any:
+    """json.dumps default hook, converts model objects one level at a time"""
+    if isinstance(obj, (ParamDoc, MemberDoc, ClassDoc, NamespaceDoc)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
\ No newline at end of file
@@ -0,0 +1,196 @@
+"""Prefix completion over class and member names"""
+
+import heapq
+import logging
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+# Prefix ranges larger than this get their top results memoized
+SCAN_LIMIT = 256
+# Results kept per memoized prefix, also the largest accepted limit
+MAX_COMPLETIONS = 50
+
+logger = logging.getLogger(__name__)
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """Levenshtein distance between a and b
+    
+    Bit-parallel (Myers/Hyyrö): one column of the DP table per character of the
+    longer string, held as +1/-1 delta bit vectors. With a limit, returns
+    limit + 1 as soon as the distance must exceed it.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return len(a)
+    
+    peq = {}  # character -> positions in b
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    mask = (1 << len(b)) - 1
+    last = 1 << (len(b) - 1)
+    pv, mv, score = mask, 0, len(b)
+    remaining = len(a)
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        remaining -= 1
+        # Each remaining column lowers the score by at most one
+        if limit is not None and score - remaining > limit:
+            return limit + 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+    return score
+
+
+class BKTree:
+    """Burkhard-Keller tree for finding words within an edit distance
+    
+    Stored flat: words[i] with children[i] = {distance: child node}, node 0 is
+    the root. The XML parser builds it into symbols.json as [word, [[distance,
+    child], ...]] nodes with scraper/utils.build_name_tree(), which must insert
+    exactly like add() (tests/test_symbol_index.py compares the two), so the
+    server never pays for the build. By the triangle
+    inequality a search only descends into children whose distance to the node
+    is within max_distance of the query's, which skips most of the words.
+    """
+    
+    def __init__(self, words=(), nodes: Optional[List] = None):
+        self.words = []
+        self.children = []
+        if nodes is not None:
+            for word, children in nodes:
+                self.words.append(word)
+                self.children.append({distance: child for distance, child in children})
+        else:
+            for word in words:
+                self.add(word)
+        # Largest child distance per node, bounds the distance a search must know exactly
+        self._reach = [max(children, default=0) for children in self.children]
+    
+    def add(self, word: str):
+        if not self.words:
+            self.words.append(word)
+            self.children.append({})
+            return
+        
+        node = 0
+        while True:
+            distance = edit_distance(word, self.words[node])
+            if distance == 0:
+                return
+            child = self.children[node].get(distance)
+            if child is None:
+                self.children[node][distance] = len(self.words)
+                self.words.append(word)
+                self.children.append({})
+                return
+            node = child
+    
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """(distance, word) pairs within max_distance of word"""
+        if not self.words:
+            return []
+        
+        matches = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            # Past reach + max_distance no child can qualify, so the exact value is not needed
+            distance = edit_distance(word, self.words[node], self._reach[node] + max_distance)
+            if distance <= max_distance:
+                matches.append((distance, self.words[node]))
+            for child_distance, child in self.children[node].items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return matches
+
+
+class SymbolIndex:
+    """Sorted name array searched by binary search
+    
+    Built from symbols.json, where keys are already sorted lowercase names
+    (simple and qualified) pointing at [display name, kind, namespace, popularity]
+    symbols. Results rank by popularity, then by shorter name.
+    """
+    
+    def __init__(self, data: Dict):
+        self.symbols = data.get("symbols", [])
+        self._keys = [key for key, _ in data.get("keys", [])]
+        self._targets = [target for _, target in data.get("keys", [])]
+        self._top = {}  # lowercase prefix -> ranked symbol positions, for large ranges
+        
+        self._names = {}  # lowercase simple name -> symbol positions
+        for position, (display, _, _, _) in enumerate(self.symbols):
+            self._names.setdefault(display.rsplit('.', 1)[-1].lower(), []).append(position)
+        
+        if "tree" in data:
+            self._tree = BKTree(nodes=data["tree"])
+        else:
+            if self.symbols:
+                logger.warning("Symbol table has no prebuilt name tree, building it now")
+            self._tree = BKTree(sorted(self._names))
+    
+    def _rank(self, position: int):
+        display, _, _, popularity = self.symbols[position]
+        return (-popularity, len(display), display)
+    
+    def _ranked(self, lo: int, hi: int, limit: int) -> List[int]:
+        """Top symbol positions among keys[lo:hi]"""
+        return heapq.nsmallest(limit, set(self._targets[lo:hi]), key=self._rank)
+    
+    def complete(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """Complete a name prefix, e.g. 'NurbsS' or 'Brep.CreateFr'"""
+        prefix = prefix.strip().lower()
+        limit = max(1, min(limit, MAX_COMPLETIONS))
+        if not prefix:
+            return []
+        
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + "\uffff", lo)
+        
+        if hi - lo > SCAN_LIMIT:
+            positions = self._top.get(prefix)
+            if positions is None:
+                positions = self._ranked(lo, hi, MAX_COMPLETIONS)
+                self._top[prefix] = positions
+        else:
+            positions = self._ranked(lo, hi, limit)
+        
+        return [
+            {"symbol": display, "type": kind, "namespace": namespace}
+            for display, kind, namespace, _ in (self.symbols[p] for p in positions[:limit])
+        ]
+    
+    def suggest(self, name: str, limit: int = 5, max_distance: Optional[int] = None) -> List[Dict]:
+        """Closest class and member names to a misspelled one, e.g. 'NurbSurface'"""
+        name = name.strip().rsplit('.', 1)[-1].lower()
+        if not name:
+            return []
+        if max_distance is None:
+            max_distance = 1 if len(name) <= 4 else 2
+        
+        matches = self._tree.search(name, max_distance)
+        candidates = [
+            (distance, self._rank(position), position)
+            for distance, word in matches
+            for position in self._names[word]
+        ]
+        
+        suggestions = []
+        for distance, _, position in heapq.nsmallest(limit, candidates):
+            display, kind, namespace, _ = self.symbols[position]
+            suggestions.append({"symbol": display, "type": kind, "namespace": namespace, "distance": distance})
+        return suggestions
\ No newline at end of file
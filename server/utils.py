@@ -0,0 +1,100 @@
+"""Utility classes for MCP server"""
+
+import asyncio
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class ConnectionLimiter:
+    """Limit concurrent requests per client session
+    
+    Sessions are held weakly, so a semaphore goes away with its connection.
+    """
+    
+    def __init__(self, max_concurrent: int):
+        self.max_concurrent = max_concurrent
+        self._semaphores = weakref.WeakKeyDictionary()
+    
+    def for_session(self, session) -> asyncio.Semaphore:
+        """Get the semaphore guarding one client session"""
+        semaphore = self._semaphores.get(session)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._semaphores[session] = semaphore
+        return semaphore
+
+
+class ResultCache:
+    """Thread-safe LRU cache for query results with single-flight computation
+    
+    Concurrent callers asking for the same missing key wait for the first
+    caller's computation instead of running their own. Cached values are shared,
+    callers must not mutate them.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._inflight = {}  # key -> Future of the running computation
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+    
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing it at most once"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        
+        with self._lock:
+            del self._inflight[key]
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        
+        future.set_result(value)
+        return value
+    
+    def clear(self):
+        """Drop all cached values, in-flight computations still complete"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit counters"""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0
+            }
\ No newline at end of file
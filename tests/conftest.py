@@ -0,0 +1,38 @@
+"""Shared fixtures
+
+server/, scraper/ and scripts/ are run from their own directories and both
+server and scraper have a config.py and utils.py, so modules are loaded by
+file path under distinct names instead of through sys.path.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def load_module(name: str, path: Path):
+    """Import path as a module called name"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def load_test():
+    return load_module("load_test", PROJECT_ROOT / "scripts" / "load_test.py")
+
+
+@pytest.fixture(scope="session")
+def symbol_index():
+    return load_module("server_symbol_index", PROJECT_ROOT / "server" / "symbol_index.py")
+
+
+@pytest.fixture(scope="session")
+def scraper_utils():
+    return load_module("scraper_utils", PROJECT_ROOT / "scraper" / "utils.py")
@@ -0,0 +1,22 @@
+"""Tests for scripts/load_test.py"""
+
+import pytest
+
+
+@pytest.mark.parametrize("values, pct, expected", [
+    ([1, 2, 3, 4, 5], 50, 3),
+    ([1, 2, 3, 4], 50, 2),
+    ([1, 2, 3, 4, 5], 0, 1),
+    ([1, 2, 3, 4, 5], 100, 5),
+    (list(range(1, 151)), 99, 149),
+    (list(range(1, 21)), 95, 19),
+    ([], 50, 0.0),
+])
+def test_percentile_nearest_rank(load_test, values, pct, expected):
+    assert load_test.percentile(list(reversed(values)), pct) == expected
+
+
+def test_not_found_is_not_an_error(load_test):
+    assert load_test.is_not_found("Class 'Brepp' not found")
+    assert load_test.is_not_found("Namespace not found: rhino.nothing")
+    assert not load_test.is_not_found("Connection closed")
@@ -0,0 +1,86 @@
+"""Tests for server/symbol_index.py and the tree the scraper prebuilds for it"""
+
+import itertools
+import random
+
+import pytest
+
+WORDS = [
+    "brep", "brepface", "brepedge", "curve", "nurbscurve", "nurbssurface",
+    "surface", "point3d", "point2d", "vector3d", "plane", "mesh", "meshface",
+    "createfromloft", "createfromcorners", "createfromsweep", "transform",
+    "", "a", "ab", "ba", "intersection", "boundingbox", "extrusion",
+]
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Plain dynamic-programming reference"""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def random_words(count: int, seed: int):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice("abcde") for _ in range(rng.randint(0, 12)))
+        for _ in range(count)
+    ]
+
+
+def test_edit_distance_matches_reference(symbol_index, scraper_utils):
+    words = WORDS + random_words(60, seed=1)
+    for a, b in itertools.product(words, repeat=2):
+        expected = levenshtein(a, b)
+        assert symbol_index.edit_distance(a, b) == expected
+        assert scraper_utils.edit_distance(a, b) == expected
+
+
+def test_edit_distance_limit(symbol_index):
+    words = WORDS + random_words(60, seed=2)
+    for a, b in itertools.product(words, repeat=2):
+        expected = levenshtein(a, b)
+        for limit in range(5):
+            assert symbol_index.edit_distance(a, b, limit) == min(expected, limit + 1)
+
+
+@pytest.mark.parametrize("words", [sorted(set(WORDS)), sorted(set(random_words(500, seed=3)))])
+def test_scraper_builds_the_server_tree(symbol_index, scraper_utils, words):
+    tree = symbol_index.BKTree(words)
+    built = [[word, sorted(children.items())] for word, children in zip(tree.words, tree.children)]
+    assert scraper_utils.build_name_tree(words) == built
+
+
+@pytest.mark.parametrize("max_distance", [0, 1, 2, 3])
+def test_search_matches_brute_force(symbol_index, scraper_utils, max_distance):
+    words = sorted(set(random_words(800, seed=4)))
+    tree = symbol_index.BKTree(nodes=scraper_utils.build_name_tree(words))
+    for query in random_words(40, seed=5):
+        expected = sorted(
+            (levenshtein(query, word), word) for word in words
+            if levenshtein(query, word) <= max_distance
+        )
+        assert sorted(tree.search(query, max_distance)) == expected
+
+
+def test_suggest_ranks_by_distance(symbol_index, scraper_utils):
+    symbols = [
+        ["NurbsSurface", "class", "rhino.geometry", 10],
+        ["NurbsCurve", "class", "rhino.geometry", 20],
+        ["Brep", "class", "rhino.geometry", 30],
+    ]
+    names = sorted({display.rsplit('.', 1)[-1].lower() for display, _, _, _ in symbols})
+    index = symbol_index.SymbolIndex({"symbols": symbols, "keys": [], "tree": scraper_utils.build_name_tree(names)})
+    suggestions = index.suggest("NurbSurface")
+    assert suggestions[0]["symbol"] == "NurbsSurface"
+    assert suggestions[0]["distance"] == 1
+
+
+def test_missing_symbol_table_does_not_warn(symbol_index, caplog):
+    index = symbol_index.SymbolIndex({})
+    assert index.suggest("Brep") == []
+    assert "prebuilt name tree" not in caplog.text